@@ -153,6 +153,12 @@ func (e *Executor) prepareExecution(manifestID string, method Method) (*Manifest
 		return nil, "", fmt.Errorf("manifest %s is %s, cannot execute", manifestID, manifest.Status)
 	}
 
+	// The store commits with synchronous=NORMAL; make sure every archived
+	// message is on disk before any original is removed from Gmail.
+	if err := e.store.CheckpointWAL(); err != nil {
+		return nil, "", fmt.Errorf("checkpoint database: %w", err)
+	}
+
 	if manifest.Status == StatusPending {
 		if err := e.manager.MoveManifest(manifestID, StatusPending, StatusInProgress); err != nil {
 			return nil, "", fmt.Errorf("move to in_progress: %w", err)
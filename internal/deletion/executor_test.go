@@ -335,6 +335,55 @@ func TestDefaultExecuteOptions(t *testing.T) {
 	}
 }
 
+func TestExecutor_CheckpointBlocked(t *testing.T) {
+	tests := []struct {
+		name string
+		run  func(exec *Executor, manifestID string) error
+	}{
+		{"Execute", func(exec *Executor, manifestID string) error {
+			return exec.Execute(context.Background(), manifestID, nil)
+		}},
+		{"ExecuteBatch", func(exec *Executor, manifestID string) error {
+			return exec.ExecuteBatch(context.Background(), manifestID)
+		}},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			mgr, err := NewManager(t.TempDir())
+			if err != nil {
+				t.Fatalf("NewManager() error = %v", err)
+			}
+			st, dbPath := testutil.NewTestStoreWithPath(t)
+			mockAPI := gmail.NewDeletionMockAPI()
+			exec := NewExecutor(mgr, st, mockAPI)
+
+			manifest, err := mgr.CreateManifest("blocked", []string{"msg1", "msg2"}, Filters{})
+			if err != nil {
+				t.Fatalf("CreateManifest() error = %v", err)
+			}
+
+			testutil.BlockWALCheckpoint(t, st, dbPath)
+
+			err = tt.run(exec, manifest.ID)
+			if err == nil || !strings.Contains(err.Error(), "checkpoint database") {
+				t.Fatalf("%s() error = %v, want checkpoint database error", tt.name, err)
+			}
+
+			if n := len(mockAPI.TrashCalls) + len(mockAPI.DeleteCalls) + len(mockAPI.BatchDeleteCalls); n != 0 {
+				t.Errorf("Gmail API calls = %d, want 0 before a durable checkpoint", n)
+			}
+			pending, err := mgr.ListPending()
+			if err != nil {
+				t.Fatalf("ListPending() error = %v", err)
+			}
+			if len(pending) != 1 {
+				t.Errorf("ListPending() = %d, want 1 (manifest should stay pending)", len(pending))
+			}
+		})
+	}
+}
+
 func TestNewExecutor(t *testing.T) {
 	tmpDir := t.TempDir()
 	mgr, err := NewManager(tmpDir)
@@ -38,6 +38,7 @@ type DuckDBEngine struct {
 	sqliteDB         *sql.DB       // Direct SQLite connection for FTS and body retrieval
 	sqliteEngine     *SQLiteEngine // Reusable engine for FTS cache, created once if sqliteDB is set
 	hasSQLiteScanner bool          // true if DuckDB's sqlite extension is loaded
+	parquetCTEsSQL   string        // WITH clause body built once from analyticsDir
 	tempTableSeq     atomic.Uint64 // Unique suffix for temp tables to avoid concurrent collisions
 
 	// Search result cache: keeps the materialized temp table alive across
@@ -122,14 +123,16 @@ func NewDuckDBEngine(analyticsDir string, sqlitePath string, sqliteDB *sql.DB, o
 		sqliteEngine = NewSQLiteEngine(sqliteDB)
 	}
 
-	return &DuckDBEngine{
+	e := &DuckDBEngine{
 		db:               db,
 		analyticsDir:     analyticsDir,
 		sqlitePath:       sqlitePath,
 		sqliteDB:         sqliteDB,
 		sqliteEngine:     sqliteEngine,
 		hasSQLiteScanner: hasSQLiteScanner,
-	}, nil
+	}
+	e.parquetCTEsSQL = e.buildParquetCTEs()
+	return e, nil
 }
 
 // Close releases DuckDB resources, including any cached search temp table.
@@ -156,14 +159,22 @@ func (e *DuckDBEngine) parquetPath(table string) string {
 	return filepath.Join(e.analyticsDir, table, "*.parquet")
 }
 
-// parquetCTEs returns common CTEs for reading all Parquet tables.
-// This is used by aggregate queries that need to join across tables.
 // parquetCTEs returns the WITH clause body that defines CTEs for all Parquet
-// tables. Columns are explicitly cast to their expected types using DuckDB's
-// REPLACE syntax, because Parquet schema inference from SQLite can store
-// integer/boolean columns as VARCHAR, causing type mismatch errors in JOINs
-// and COALESCE expressions.
+// tables. It is used by every query that joins across tables, and depends
+// only on analyticsDir, so NewDuckDBEngine builds it once.
 func (e *DuckDBEngine) parquetCTEs() string {
+	if e.parquetCTEsSQL == "" {
+		return e.buildParquetCTEs()
+	}
+	return e.parquetCTEsSQL
+}
+
+// buildParquetCTEs formats the CTE definitions for analyticsDir. Columns are
+// explicitly cast to their expected types using DuckDB's REPLACE syntax,
+// because Parquet schema inference from SQLite can store integer/boolean
+// columns as VARCHAR, causing type mismatch errors in JOINs and COALESCE
+// expressions.
+func (e *DuckDBEngine) buildParquetCTEs() string {
 	return fmt.Sprintf(`
 		msg AS (
 			SELECT * REPLACE (
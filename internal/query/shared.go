@@ -21,7 +21,7 @@ func fetchLabelsForMessageList(ctx context.Context, db *sql.DB, tablePrefix stri
 
 	ids := make([]interface{}, len(messages))
 	placeholders := make([]string, len(messages))
-	idToIndex := make(map[int64]int)
+	idToIndex := make(map[int64]int, len(messages))
 	for i, msg := range messages {
 		ids[i] = msg.ID
 		placeholders[i] = "?"
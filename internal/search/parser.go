@@ -264,11 +264,13 @@ func parseDate(value string) *time.Time {
 	return nil
 }
 
+// relativeDatePattern matches relative dates like 7d, 2w, 1m, 1y.
+var relativeDatePattern = regexp.MustCompile(`^(\d+)([dwmy])$`)
+
 // parseRelativeDate parses relative dates like 7d, 2w, 1m, 1y relative to now.
 func parseRelativeDate(value string, now time.Time) *time.Time {
 	value = strings.TrimSpace(strings.ToLower(value))
-	re := regexp.MustCompile(`^(\d+)([dwmy])$`)
-	match := re.FindStringSubmatch(value)
+	match := relativeDatePattern.FindStringSubmatch(value)
 	if match == nil {
 		return nil
 	}
@@ -30,6 +30,18 @@ type APIAttachment struct {
 	Size     int64
 }
 
+// apiMessageColumns is the standard 7-column message row set scanned by
+// scanMessageRows. Queries using it must alias messages as m and join the
+// 'from' participant as p.
+const apiMessageColumns = `
+			m.id,
+			COALESCE(m.subject, '') as subject,
+			COALESCE(p.email_address, '') as from_email,
+			COALESCE(m.sent_at, m.received_at, m.internal_date) as sent_at,
+			COALESCE(m.snippet, '') as snippet,
+			m.has_attachments,
+			m.size_estimate`
+
 // ListMessages returns a paginated list of messages with batch-loaded recipients and labels.
 func (s *Store) ListMessages(offset, limit int) ([]APIMessage, int64, error) {
 	// Get total count
@@ -41,14 +53,7 @@ func (s *Store) ListMessages(offset, limit int) ([]APIMessage, int64, error) {
 
 	// Query messages with sender info
 	query := `
-		SELECT
-			m.id,
-			COALESCE(m.subject, '') as subject,
-			COALESCE(p.email_address, '') as from_email,
-			COALESCE(m.sent_at, m.received_at, m.internal_date) as sent_at,
-			COALESCE(m.snippet, '') as snippet,
-			m.has_attachments,
-			m.size_estimate
+		SELECT` + apiMessageColumns + `
 		FROM messages m
 		LEFT JOIN message_recipients mr ON mr.message_id = m.id AND mr.recipient_type = 'from'
 		LEFT JOIN participants p ON p.id = mr.participant_id
@@ -94,26 +99,23 @@ func (s *Store) ListMessages(offset, limit int) ([]APIMessage, int64, error) {
 }
 
 // GetMessage returns a single message with full details.
-// Only this method accesses message_bodies (single PK lookup).
+// Only this method accesses message_bodies, via a PK join in the main query.
 func (s *Store) GetMessage(id int64) (*APIMessage, error) {
 	query := `
-		SELECT
-			m.id,
-			COALESCE(m.subject, '') as subject,
-			COALESCE(p.email_address, '') as from_email,
-			COALESCE(m.sent_at, m.received_at, m.internal_date) as sent_at,
-			COALESCE(m.snippet, '') as snippet,
-			m.has_attachments,
-			m.size_estimate
+		SELECT` + apiMessageColumns + `,
+			mb.body_text,
+			mb.body_html
 		FROM messages m
 		LEFT JOIN message_recipients mr ON mr.message_id = m.id AND mr.recipient_type = 'from'
 		LEFT JOIN participants p ON p.id = mr.participant_id
+		LEFT JOIN message_bodies mb ON mb.message_id = m.id
 		WHERE m.id = ? AND m.deleted_from_source_at IS NULL
 	`
 
 	var m APIMessage
 	var sentAtStr sql.NullString
-	err := s.db.QueryRow(query, id).Scan(&m.ID, &m.Subject, &m.From, &sentAtStr, &m.Snippet, &m.HasAttachments, &m.SizeEstimate)
+	var bodyText, bodyHTML sql.NullString
+	err := s.db.QueryRow(query, id).Scan(&m.ID, &m.Subject, &m.From, &sentAtStr, &m.Snippet, &m.HasAttachments, &m.SizeEstimate, &bodyText, &bodyHTML)
 	if err == sql.ErrNoRows {
 		return nil, nil
 	}
@@ -136,12 +138,7 @@ func (s *Store) GetMessage(id int64) (*APIMessage, error) {
 		return nil, err
 	}
 
-	// Get body (single PK lookup — only place we touch message_bodies)
-	var bodyText, bodyHTML sql.NullString
-	err = s.db.QueryRow("SELECT body_text, body_html FROM message_bodies WHERE message_id = ?", id).Scan(&bodyText, &bodyHTML)
-	if err != nil && err != sql.ErrNoRows {
-		return nil, fmt.Errorf("get message body: %w", err)
-	}
+	// Body comes from the PK join above (only place we touch message_bodies)
 	if bodyText.Valid {
 		m.Body = bodyText.String
 	} else if bodyHTML.Valid {
@@ -167,16 +164,15 @@ func (s *Store) GetMessage(id int64) (*APIMessage, error) {
 
 // SearchMessages searches messages using FTS5, with batch-loaded recipients and labels.
 func (s *Store) SearchMessages(query string, offset, limit int) ([]APIMessage, int64, error) {
+	// FTS5 availability is probed once by InitSchema; don't pay for a
+	// doomed MATCH query on every search when the module is missing.
+	if !s.fts5Available {
+		return s.searchMessagesLike(query, offset, limit)
+	}
+
 	// First try FTS5 search
 	ftsQuery := `
-		SELECT
-			m.id,
-			COALESCE(m.subject, '') as subject,
-			COALESCE(p.email_address, '') as from_email,
-			COALESCE(m.sent_at, m.received_at, m.internal_date) as sent_at,
-			COALESCE(m.snippet, '') as snippet,
-			m.has_attachments,
-			m.size_estimate
+		SELECT` + apiMessageColumns + `
 		FROM messages_fts fts
 		JOIN messages m ON m.id = fts.rowid
 		LEFT JOIN message_recipients mr ON mr.message_id = m.id AND mr.recipient_type = 'from'
@@ -246,14 +242,7 @@ func (s *Store) searchMessagesLike(query string, offset, limit int) ([]APIMessag
 	}
 
 	searchQuery := `
-		SELECT
-			m.id,
-			COALESCE(m.subject, '') as subject,
-			COALESCE(p.email_address, '') as from_email,
-			COALESCE(m.sent_at, m.received_at, m.internal_date) as sent_at,
-			COALESCE(m.snippet, '') as snippet,
-			m.has_attachments,
-			m.size_estimate
+		SELECT` + apiMessageColumns + `
 		FROM messages m
 		LEFT JOIN message_recipients mr ON mr.message_id = m.id AND mr.recipient_type = 'from'
 		LEFT JOIN participants p ON p.id = mr.participant_id
@@ -286,7 +275,7 @@ func (s *Store) searchMessagesLike(query string, offset, limit int) ([]APIMessag
 	return messages, total, nil
 }
 
-// scanMessageRows scans the standard 7-column message row set.
+// scanMessageRows scans the apiMessageColumns row set.
 // Uses string scanning for dates to handle all SQLite datetime formats robustly.
 func scanMessageRows(rows *sql.Rows) ([]APIMessage, []int64, error) {
 	var messages []APIMessage
@@ -311,28 +300,10 @@ func scanMessageRows(rows *sql.Rows) ([]APIMessage, []int64, error) {
 }
 
 // parseSQLiteTime parses a datetime string from SQLite into time.Time.
-// Uses the same comprehensive format list as dbTimeLayouts in sync.go.
+// Parses with dbTimeLayouts; unparseable strings yield the zero time.
 func parseSQLiteTime(s string) time.Time {
-	// Same formats as dbTimeLayouts - order matters: more specific first
-	layouts := []string{
-		"2006-01-02 15:04:05.999999999-07:00", // space-separated with fractional seconds and TZ
-		"2006-01-02T15:04:05.999999999-07:00", // T-separated with fractional seconds and TZ
-		"2006-01-02 15:04:05.999999999",       // space-separated with fractional seconds
-		"2006-01-02T15:04:05.999999999",       // T-separated with fractional seconds
-		"2006-01-02 15:04:05",                 // SQLite datetime('now') format
-		"2006-01-02T15:04:05",                 // T-separated basic
-		"2006-01-02 15:04",                    // space-separated without seconds
-		"2006-01-02T15:04",                    // T-separated without seconds
-		"2006-01-02",                          // date only
-		time.RFC3339,                          // e.g., "2006-01-02T15:04:05Z"
-		time.RFC3339Nano,                      // e.g., "2006-01-02T15:04:05.999999999Z07:00"
-	}
-	for _, layout := range layouts {
-		if t, err := time.Parse(layout, s); err == nil {
-			return t
-		}
-	}
-	return time.Time{}
+	t, _ := matchDBTime(s)
+	return t
 }
 
 // batchPopulate batch-loads recipients and labels for a slice of messages.
@@ -231,3 +231,82 @@ func TestSearchMessagesLikeLiteralWildcards(t *testing.T) {
 		})
 	}
 }
+
+func TestGetMessageBody(t *testing.T) {
+	st := openTestStore(t)
+
+	source, err := st.GetOrCreateSource("gmail", "test@example.com")
+	if err != nil {
+		t.Fatalf("GetOrCreateSource: %v", err)
+	}
+	convID, err := st.EnsureConversation(source.ID, "thread-1", "Thread")
+	if err != nil {
+		t.Fatalf("EnsureConversation: %v", err)
+	}
+
+	textID := seedMessage(t, st, source.ID, convID, "msg-text", "text", "")
+	if err := st.UpsertMessageBody(textID,
+		sql.NullString{String: "plain body", Valid: true},
+		sql.NullString{String: "<p>html body</p>", Valid: true},
+	); err != nil {
+		t.Fatalf("UpsertMessageBody(text): %v", err)
+	}
+	htmlID := seedMessage(t, st, source.ID, convID, "msg-html", "html", "")
+	if err := st.UpsertMessageBody(htmlID,
+		sql.NullString{},
+		sql.NullString{String: "<p>html only</p>", Valid: true},
+	); err != nil {
+		t.Fatalf("UpsertMessageBody(html): %v", err)
+	}
+	noBodyID := seedMessage(t, st, source.ID, convID, "msg-nobody", "none", "")
+
+	tests := []struct {
+		name string
+		id   int64
+		want string
+	}{
+		{"prefers body_text", textID, "plain body"},
+		{"falls back to body_html", htmlID, "<p>html only</p>"},
+		{"missing body row", noBodyID, ""},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			m, err := st.GetMessage(tt.id)
+			if err != nil {
+				t.Fatalf("GetMessage(%d): %v", tt.id, err)
+			}
+			if m == nil {
+				t.Fatalf("GetMessage(%d) = nil", tt.id)
+			}
+			if m.Body != tt.want {
+				t.Errorf("Body = %q, want %q", m.Body, tt.want)
+			}
+		})
+	}
+}
+
+func TestSearchMessagesWithoutFTS5UsesLike(t *testing.T) {
+	st := openTestStore(t)
+
+	source, err := st.GetOrCreateSource("gmail", "test@example.com")
+	if err != nil {
+		t.Fatalf("GetOrCreateSource: %v", err)
+	}
+	convID, err := st.EnsureConversation(source.ID, "thread-1", "Thread")
+	if err != nil {
+		t.Fatalf("EnsureConversation: %v", err)
+	}
+	seedMessage(t, st, source.ID, convID, "msg-1", "quarterly report", "numbers")
+
+	// Simulate a build without FTS5: search must go straight to LIKE.
+	st.fts5Available = false
+
+	messages, total, err := st.SearchMessages("quarterly", 0, 10)
+	if err != nil {
+		t.Fatalf("SearchMessages: %v", err)
+	}
+	if total != 1 || len(messages) != 1 {
+		t.Errorf("SearchMessages = %d rows (total %d), want 1 (total 1)", len(messages), total)
+	}
+}
@@ -67,7 +67,7 @@ func (s *Store) MessageExistsBatch(sourceID int64, sourceMessageIDs []string) (m
 		return make(map[string]int64), nil
 	}
 
-	result := make(map[string]int64)
+	result := make(map[string]int64, len(sourceMessageIDs))
 	err := queryInChunks(s.db, sourceMessageIDs, []interface{}{sourceID},
 		`SELECT source_message_id, id FROM messages WHERE source_id = ? AND source_message_id IN (%s)`,
 		func(rows *sql.Rows) error {
@@ -93,7 +93,7 @@ func (s *Store) MessageExistsWithRawBatch(sourceID int64, sourceMessageIDs []str
 		return make(map[string]int64), nil
 	}
 
-	result := make(map[string]int64)
+	result := make(map[string]int64, len(sourceMessageIDs))
 	err := queryInChunks(s.db, sourceMessageIDs, []interface{}{sourceID},
 		`SELECT m.source_message_id, m.id
 		 FROM messages m
@@ -344,20 +344,32 @@ func (s *Store) EnsureParticipantsBatch(addresses []mime.Address) (map[string]in
 		return make(map[string]int64), nil
 	}
 
-	result := make(map[string]int64)
+	result := make(map[string]int64, len(addresses))
 
-	// First, try to insert all (ignoring conflicts)
-	for _, addr := range addresses {
-		if addr.Email == "" {
-			continue
-		}
-		_, err := s.db.Exec(`
+	// First, try to insert all (ignoring conflicts) with one prepared
+	// statement in a single transaction.
+	err := s.withTx(func(tx *sql.Tx) error {
+		stmt, err := tx.Prepare(`
 			INSERT OR IGNORE INTO participants (email_address, display_name, domain, created_at, updated_at)
 			VALUES (?, ?, ?, datetime('now'), datetime('now'))
-		`, addr.Email, addr.Name, addr.Domain)
+		`)
 		if err != nil {
-			return nil, err
+			return err
 		}
+		defer stmt.Close()
+
+		for _, addr := range addresses {
+			if addr.Email == "" {
+				continue
+			}
+			if _, err := stmt.Exec(addr.Email, addr.Name, addr.Domain); err != nil {
+				return err
+			}
+		}
+		return nil
+	})
+	if err != nil {
+		return nil, err
 	}
 
 	// Then fetch all IDs
@@ -372,7 +384,7 @@ func (s *Store) EnsureParticipantsBatch(addresses []mime.Address) (map[string]in
 		return result, nil
 	}
 
-	err := queryInChunks(s.db, emails, nil,
+	err = queryInChunks(s.db, emails, nil,
 		`SELECT email_address, id FROM participants WHERE email_address IN (%s)`,
 		func(rows *sql.Rows) error {
 			var email string
@@ -434,13 +446,24 @@ type Label struct {
 	LabelType     sql.NullString
 }
 
+const (
+	selectLabelIDSQL = `SELECT id FROM labels WHERE source_id = ? AND source_label_id = ?`
+	insertLabelSQL   = `
+		INSERT INTO labels (source_id, source_label_id, name, label_type)
+		VALUES (?, ?, ?, ?)`
+	insertLabelIfMissingSQL = `
+		INSERT INTO labels (source_id, source_label_id, name, label_type)
+		SELECT ?, ?, ?, ?
+		WHERE NOT EXISTS (
+			SELECT 1 FROM labels WHERE source_id = ? AND source_label_id = ?
+		)`
+)
+
 // EnsureLabel gets or creates a label.
 func (s *Store) EnsureLabel(sourceID int64, sourceLabelID, name, labelType string) (int64, error) {
 	// Try to get existing
 	var id int64
-	err := s.db.QueryRow(`
-		SELECT id FROM labels WHERE source_id = ? AND source_label_id = ?
-	`, sourceID, sourceLabelID).Scan(&id)
+	err := s.db.QueryRow(selectLabelIDSQL, sourceID, sourceLabelID).Scan(&id)
 
 	if err == nil {
 		return id, nil
@@ -450,10 +473,7 @@ func (s *Store) EnsureLabel(sourceID int64, sourceLabelID, name, labelType strin
 	}
 
 	// Create new
-	result, err := s.db.Exec(`
-		INSERT INTO labels (source_id, source_label_id, name, label_type)
-		VALUES (?, ?, ?, ?)
-	`, sourceID, sourceLabelID, name, labelType)
+	result, err := s.db.Exec(insertLabelSQL, sourceID, sourceLabelID, name, labelType)
 	if err != nil {
 		return 0, err
 	}
@@ -477,15 +497,46 @@ func IsSystemLabel(sourceLabelID string) bool {
 }
 
 // EnsureLabelsBatch ensures all labels exist and returns a map of source_label_id -> internal ID.
+// The batch runs in one transaction that writes before it reads, so it takes
+// the write lock up front and waits on the busy timeout if another process
+// is writing. The batch is all-or-nothing: a UNIQUE(source_id, name) conflict
+// on one label rolls back every label in the call.
 func (s *Store) EnsureLabelsBatch(sourceID int64, labels map[string]LabelInfo) (map[string]int64, error) {
-	result := make(map[string]int64)
+	result := make(map[string]int64, len(labels))
+	if len(labels) == 0 {
+		return result, nil
+	}
 
-	for sourceLabelID, info := range labels {
-		id, err := s.EnsureLabel(sourceID, sourceLabelID, info.Name, info.Type)
+	err := s.withTx(func(tx *sql.Tx) error {
+		insertStmt, err := tx.Prepare(insertLabelIfMissingSQL)
 		if err != nil {
-			return nil, err
+			return err
+		}
+		defer insertStmt.Close()
+
+		for sourceLabelID, info := range labels {
+			if _, err := insertStmt.Exec(sourceID, sourceLabelID, info.Name, info.Type, sourceID, sourceLabelID); err != nil {
+				return err
+			}
+		}
+
+		selectStmt, err := tx.Prepare(selectLabelIDSQL)
+		if err != nil {
+			return err
+		}
+		defer selectStmt.Close()
+
+		for sourceLabelID := range labels {
+			var id int64
+			if err := selectStmt.QueryRow(sourceID, sourceLabelID).Scan(&id); err != nil {
+				return err
+			}
+			result[sourceLabelID] = id
 		}
-		result[sourceLabelID] = id
+		return nil
+	})
+	if err != nil {
+		return nil, err
 	}
 
 	return result, nil
@@ -549,8 +600,10 @@ func (s *Store) RemoveMessageLabels(messageID int64, labelIDs []int64) error {
 	if len(labelIDs) == 0 {
 		return nil
 	}
-	return execInChunks(s.db, labelIDs, []interface{}{messageID},
-		`DELETE FROM message_labels WHERE message_id = ? AND label_id IN (%s)`)
+	return s.withTx(func(tx *sql.Tx) error {
+		return execInChunks(tx, labelIDs, []interface{}{messageID},
+			`DELETE FROM message_labels WHERE message_id = ? AND label_id IN (%s)`)
+	})
 }
 
 // MarkMessageDeleted marks a message as deleted from the source.
@@ -568,8 +621,10 @@ func (s *Store) MarkMessagesDeletedBatch(sourceID int64, sourceMessageIDs []stri
 	if len(sourceMessageIDs) == 0 {
 		return nil
 	}
-	return execInChunks(s.db, sourceMessageIDs, []interface{}{sourceID},
-		`UPDATE messages SET deleted_from_source_at = datetime('now') WHERE source_id = ? AND source_message_id IN (%s)`)
+	return s.withTx(func(tx *sql.Tx) error {
+		return execInChunks(tx, sourceMessageIDs, []interface{}{sourceID},
+			`UPDATE messages SET deleted_from_source_at = datetime('now') WHERE source_id = ? AND source_message_id IN (%s)`)
+	})
 }
 
 // MarkMessageDeletedByGmailID marks a message as deleted by its Gmail ID.
@@ -801,17 +856,28 @@ func (s *Store) BackfillFTS(progress func(done, total int64)) (int64, error) {
 }
 
 // backfillFTSBatch inserts FTS rows for messages with id in [fromID, toID).
+// Recipient addresses for the whole batch are gathered in one grouped scan of
+// message_recipients and partitioned by type.
 func (s *Store) backfillFTSBatch(fromID, toID int64) (int64, error) {
 	result, err := s.db.Exec(`
 		INSERT OR REPLACE INTO messages_fts (rowid, message_id, subject, body, from_addr, to_addr, cc_addr)
 		SELECT m.id, m.id, COALESCE(m.subject, ''), COALESCE(mb.body_text, ''),
-			COALESCE((SELECT GROUP_CONCAT(p.email_address, ' ') FROM message_recipients mr JOIN participants p ON p.id = mr.participant_id WHERE mr.message_id = m.id AND mr.recipient_type = 'from'), ''),
-			COALESCE((SELECT GROUP_CONCAT(p.email_address, ' ') FROM message_recipients mr JOIN participants p ON p.id = mr.participant_id WHERE mr.message_id = m.id AND mr.recipient_type = 'to'), ''),
-			COALESCE((SELECT GROUP_CONCAT(p.email_address, ' ') FROM message_recipients mr JOIN participants p ON p.id = mr.participant_id WHERE mr.message_id = m.id AND mr.recipient_type = 'cc'), '')
+			COALESCE(r.from_addr, ''), COALESCE(r.to_addr, ''), COALESCE(r.cc_addr, '')
 		FROM messages m
 		LEFT JOIN message_bodies mb ON mb.message_id = m.id
+		LEFT JOIN (
+			SELECT mr.message_id,
+				GROUP_CONCAT(CASE WHEN mr.recipient_type = 'from' THEN p.email_address END, ' ') AS from_addr,
+				GROUP_CONCAT(CASE WHEN mr.recipient_type = 'to' THEN p.email_address END, ' ') AS to_addr,
+				GROUP_CONCAT(CASE WHEN mr.recipient_type = 'cc' THEN p.email_address END, ' ') AS cc_addr
+			FROM message_recipients mr
+			JOIN participants p ON p.id = mr.participant_id
+			WHERE mr.message_id >= ? AND mr.message_id < ?
+			  AND mr.recipient_type IN ('from', 'to', 'cc')
+			GROUP BY mr.message_id
+		) r ON r.message_id = m.id
 		WHERE m.id >= ? AND m.id < ?
-	`, fromID, toID)
+	`, fromID, toID, fromID, toID)
 	if err != nil {
 		return 0, err
 	}
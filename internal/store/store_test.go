@@ -3,6 +3,8 @@ package store_test
 import (
 	"database/sql"
 	"fmt"
+	"os"
+	"path/filepath"
 	"testing"
 	"time"
 
@@ -23,6 +25,62 @@ func TestStore_Open(t *testing.T) {
 	}
 }
 
+func TestStore_Open_Pragmas(t *testing.T) {
+	st := testutil.NewTestStore(t)
+
+	tests := []struct {
+		pragma string
+		want   int64
+	}{
+		{"synchronous", 1}, // NORMAL
+		{"cache_size", -65536},
+		{"foreign_keys", 1},
+	}
+	for _, tt := range tests {
+		var got int64
+		err := st.DB().QueryRow("PRAGMA " + tt.pragma).Scan(&got)
+		testutil.MustNoErr(t, err, "PRAGMA "+tt.pragma)
+		if got != tt.want {
+			t.Errorf("PRAGMA %s = %d, want %d", tt.pragma, got, tt.want)
+		}
+	}
+}
+
+func TestStore_CheckpointWAL(t *testing.T) {
+	st, dbPath := testutil.NewTestStoreWithPath(t)
+
+	_, err := st.GetOrCreateSource("gmail", "durable@example.com")
+	testutil.MustNoErr(t, err, "GetOrCreateSource()")
+
+	testutil.MustNoErr(t, st.CheckpointWAL(), "CheckpointWAL()")
+
+	// Copy only the main database file. Without the WAL, the copy sees
+	// exactly what the checkpoint wrote back.
+	data, err := os.ReadFile(dbPath)
+	testutil.MustNoErr(t, err, "read main database file")
+	copyPath := filepath.Join(t.TempDir(), "copy.db")
+	testutil.MustNoErr(t, os.WriteFile(copyPath, data, 0600), "write copy")
+
+	copySt, err := store.Open(copyPath)
+	testutil.MustNoErr(t, err, "open copy")
+	defer copySt.Close()
+
+	src, err := copySt.GetSourceByIdentifier("durable@example.com")
+	testutil.MustNoErr(t, err, "GetSourceByIdentifier() on copy")
+	if src == nil {
+		t.Error("source missing from main database file after CheckpointWAL")
+	}
+}
+
+func TestStore_CheckpointWAL_BlockedByReader(t *testing.T) {
+	st, dbPath := testutil.NewTestStoreWithPath(t)
+	testutil.BlockWALCheckpoint(t, st, dbPath)
+
+	if err := st.CheckpointWAL(); err == nil {
+		t.Fatal("CheckpointWAL() with a reader on a stale snapshot should fail")
+	}
+}
+
 func TestStore_GetStats_Empty(t *testing.T) {
 	st := testutil.NewTestStore(t)
 
@@ -336,6 +394,50 @@ func TestStore_EnsureLabelsBatch(t *testing.T) {
 			t.Errorf("%s should be in result", sourceLabelID)
 		}
 	}
+
+	// A second batch with existing and new labels reuses the existing IDs
+	labels["Label_67890"] = store.LabelInfo{Name: "Other Label", Type: "user"}
+	again, err := f.Store.EnsureLabelsBatch(f.Source.ID, labels)
+	testutil.MustNoErr(t, err, "EnsureLabelsBatch() second call")
+
+	if len(again) != 4 {
+		t.Errorf("len(again) = %d, want 4", len(again))
+	}
+	for sourceLabelID, id := range result {
+		if again[sourceLabelID] != id {
+			t.Errorf("%s: second call ID = %d, want %d", sourceLabelID, again[sourceLabelID], id)
+		}
+	}
+	if again["Label_67890"] == 0 {
+		t.Error("Label_67890 should have a non-zero ID")
+	}
+}
+
+func TestStore_EnsureLabelsBatch_NameConflictRollsBack(t *testing.T) {
+	f := storetest.New(t)
+
+	_, err := f.Store.EnsureLabelsBatch(f.Source.ID, map[string]store.LabelInfo{
+		"Label_1": {Name: "Work", Type: "user"},
+	})
+	testutil.MustNoErr(t, err, "EnsureLabelsBatch() seed")
+
+	// Label_2 reuses the name "Work", violating UNIQUE(source_id, name)
+	_, err = f.Store.EnsureLabelsBatch(f.Source.ID, map[string]store.LabelInfo{
+		"Label_2": {Name: "Work", Type: "user"},
+		"Label_3": {Name: "Personal", Type: "user"},
+	})
+	if err == nil {
+		t.Fatal("EnsureLabelsBatch() with duplicate name should fail")
+	}
+
+	var labelCount int
+	err = f.Store.DB().QueryRow(
+		`SELECT COUNT(*) FROM labels WHERE source_id = ?`, f.Source.ID,
+	).Scan(&labelCount)
+	testutil.MustNoErr(t, err, "count labels")
+	if labelCount != 1 {
+		t.Errorf("label count = %d, want 1 (failed batch should roll back)", labelCount)
+	}
 }
 
 func TestStore_MessageLabels(t *testing.T) {
@@ -988,6 +1090,14 @@ func TestStore_BackfillFTS(t *testing.T) {
 	err = f.Store.ReplaceMessageRecipients(msgID1, "to", []int64{pid2}, []string{"Recipient"})
 	testutil.MustNoErr(t, err, "ReplaceMessageRecipients to")
 
+	pid3 := f.EnsureParticipant("ccperson@example.com", "CC Person", "example.com")
+	err = f.Store.ReplaceMessageRecipients(msgID1, "cc", []int64{pid3}, []string{"CC Person"})
+	testutil.MustNoErr(t, err, "ReplaceMessageRecipients cc")
+
+	pid4 := f.EnsureParticipant("hiddenbcc@example.com", "Hidden", "example.com")
+	err = f.Store.ReplaceMessageRecipients(msgID1, "bcc", []int64{pid4}, []string{"Hidden"})
+	testutil.MustNoErr(t, err, "ReplaceMessageRecipients bcc")
+
 	msgID2 := f.CreateMessage("msg-backfill-2")
 	err = f.Store.UpsertMessageBody(msgID2,
 		sql.NullString{String: "second message unique content", Valid: true},
@@ -1041,6 +1151,28 @@ func TestStore_BackfillFTS(t *testing.T) {
 	if count != 1 {
 		t.Errorf("FTS match 'unique' = %d, want 1", count)
 	}
+
+	// Each recipient type lands in its own column; bcc is not indexed
+	columnMatches := []struct {
+		match string
+		want  int
+	}{
+		{"from_addr:sender", 1},
+		{"to_addr:recipient", 1},
+		{"cc_addr:ccperson", 1},
+		{"from_addr:recipient", 0},
+		{"to_addr:sender", 0},
+		{"to_addr:ccperson", 0},
+		{"cc_addr:recipient", 0},
+		{"hiddenbcc", 0},
+	}
+	for _, tt := range columnMatches {
+		err = f.Store.DB().QueryRow("SELECT COUNT(*) FROM messages_fts WHERE messages_fts MATCH ?", tt.match).Scan(&count)
+		testutil.MustNoErr(t, err, "FTS MATCH "+tt.match)
+		if count != tt.want {
+			t.Errorf("FTS match %q = %d, want %d", tt.match, count, tt.want)
+		}
+	}
 }
 
 func TestStore_FTS5Available(t *testing.T) {
@@ -1208,6 +1340,30 @@ func TestStore_RemoveMessageLabels(t *testing.T) {
 	f.AssertLabelCount(msgID, 1)
 }
 
+func TestStore_RemoveMessageLabels_LargeBatch(t *testing.T) {
+	f := storetest.New(t)
+
+	msgID := f.CreateMessage("msg-remove-large-labels")
+
+	// 600 labels spans two chunks of the chunked DELETE
+	const numLabels = 600
+	labelIDs := make([]int64, numLabels)
+	for i := 0; i < numLabels; i++ {
+		sourceLabelID := fmt.Sprintf("Label_%d", i)
+		lid, err := f.Store.EnsureLabel(f.Source.ID, sourceLabelID, fmt.Sprintf("Label %d", i), "user")
+		testutil.MustNoErr(t, err, "EnsureLabel")
+		labelIDs[i] = lid
+	}
+
+	err := f.Store.ReplaceMessageLabels(msgID, labelIDs)
+	testutil.MustNoErr(t, err, "ReplaceMessageLabels(600 labels)")
+	f.AssertLabelCount(msgID, numLabels)
+
+	err = f.Store.RemoveMessageLabels(msgID, labelIDs[:550])
+	testutil.MustNoErr(t, err, "RemoveMessageLabels(550 labels)")
+	f.AssertLabelCount(msgID, 50)
+}
+
 func TestStore_MarkMessagesDeletedBatch(t *testing.T) {
 	f := storetest.New(t)
 
@@ -414,28 +414,18 @@ func populateFTS(db *sql.DB) error {
 		)
 		SELECT m.id, m.id, COALESCE(m.subject, ''),
 			COALESCE(mb.body_text, ''),
-			COALESCE((
-				SELECT GROUP_CONCAT(p.email_address, ' ')
-				FROM message_recipients mr
-				JOIN participants p ON p.id = mr.participant_id
-				WHERE mr.message_id = m.id
-				  AND mr.recipient_type = 'from'
-			), ''),
-			COALESCE((
-				SELECT GROUP_CONCAT(p.email_address, ' ')
-				FROM message_recipients mr
-				JOIN participants p ON p.id = mr.participant_id
-				WHERE mr.message_id = m.id
-				  AND mr.recipient_type = 'to'
-			), ''),
-			COALESCE((
-				SELECT GROUP_CONCAT(p.email_address, ' ')
-				FROM message_recipients mr
-				JOIN participants p ON p.id = mr.participant_id
-				WHERE mr.message_id = m.id
-				  AND mr.recipient_type = 'cc'
-			), '')
+			COALESCE(r.from_addr, ''), COALESCE(r.to_addr, ''), COALESCE(r.cc_addr, '')
 		FROM messages m
-		LEFT JOIN message_bodies mb ON mb.message_id = m.id`)
+		LEFT JOIN message_bodies mb ON mb.message_id = m.id
+		LEFT JOIN (
+			SELECT mr.message_id,
+				GROUP_CONCAT(CASE WHEN mr.recipient_type = 'from' THEN p.email_address END, ' ') AS from_addr,
+				GROUP_CONCAT(CASE WHEN mr.recipient_type = 'to' THEN p.email_address END, ' ') AS to_addr,
+				GROUP_CONCAT(CASE WHEN mr.recipient_type = 'cc' THEN p.email_address END, ' ') AS cc_addr
+			FROM message_recipients mr
+			JOIN participants p ON p.id = mr.participant_id
+			WHERE mr.recipient_type IN ('from', 'to', 'cc')
+			GROUP BY mr.message_id
+		) r ON r.message_id = m.id`)
 	return err
 }
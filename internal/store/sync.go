@@ -39,12 +39,21 @@ type scanner interface {
 
 // parseDBTime attempts to parse a timestamp string using known SQLite/go-sqlite3 formats.
 func parseDBTime(s string) (time.Time, error) {
+	if t, ok := matchDBTime(s); ok {
+		return t, nil
+	}
+	return time.Time{}, fmt.Errorf("unrecognized timestamp format %q", s)
+}
+
+// matchDBTime parses s with the first matching layout in dbTimeLayouts,
+// reporting whether any layout matched.
+func matchDBTime(s string) (time.Time, bool) {
 	for _, layout := range dbTimeLayouts {
 		if t, err := time.Parse(layout, s); err == nil {
-			return t, nil
+			return t, true
 		}
 	}
-	return time.Time{}, fmt.Errorf("unrecognized timestamp format %q", s)
+	return time.Time{}, false
 }
 
 func parseNullTime(ns sql.NullString) (sql.NullTime, error) {
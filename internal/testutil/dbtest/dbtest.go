@@ -8,6 +8,7 @@ import (
 	"errors"
 	"fmt"
 	"os"
+	"strings"
 	"testing"
 
 	_ "github.com/mattn/go-sqlite3"
@@ -39,6 +40,11 @@ func NewTestDB(t testing.TB, schemaPath string) *TestDB {
 	}
 	t.Cleanup(func() { db.Close() })
 
+	// Every ":memory:" connection is a separate, empty database. Pin the
+	// pool to one connection so all statements share the seeded schema,
+	// matching store.Open's single-connection setup.
+	db.SetMaxOpenConns(1)
+
 	schema, err := os.ReadFile(schemaPath)
 	if err != nil {
 		t.Fatalf("read schema.sql: %v", err)
@@ -360,43 +366,29 @@ func (tdb *TestDB) AddMessage(opts MessageOpts) int64 {
 		tdb.T.Fatalf("AddMessage: %v", err)
 	}
 
-	if opts.FromID != 0 {
-		_, err = tdb.DB.Exec(
-			`INSERT INTO message_recipients (message_id, participant_id, recipient_type) VALUES (?, ?, 'from')`,
-			id, opts.FromID,
-		)
-		if err != nil {
-			tdb.T.Fatalf("AddMessage from recipient: %v", err)
+	// Insert all recipients in one multi-row INSERT.
+	var values []string
+	var args []interface{}
+	addRecipients := func(recipientType string, participantIDs ...int64) {
+		for _, pid := range participantIDs {
+			values = append(values, "(?, ?, ?)")
+			args = append(args, id, pid, recipientType)
 		}
 	}
-
-	for _, toID := range opts.ToIDs {
-		_, err = tdb.DB.Exec(
-			`INSERT INTO message_recipients (message_id, participant_id, recipient_type) VALUES (?, ?, 'to')`,
-			id, toID,
-		)
-		if err != nil {
-			tdb.T.Fatalf("AddMessage to recipient: %v", err)
-		}
-	}
-
-	for _, ccID := range opts.CcIDs {
-		_, err = tdb.DB.Exec(
-			`INSERT INTO message_recipients (message_id, participant_id, recipient_type) VALUES (?, ?, 'cc')`,
-			id, ccID,
-		)
-		if err != nil {
-			tdb.T.Fatalf("AddMessage cc recipient: %v", err)
-		}
+	if opts.FromID != 0 {
+		addRecipients("from", opts.FromID)
 	}
+	addRecipients("to", opts.ToIDs...)
+	addRecipients("cc", opts.CcIDs...)
+	addRecipients("bcc", opts.BccIDs...)
 
-	for _, bccID := range opts.BccIDs {
+	if len(values) > 0 {
 		_, err = tdb.DB.Exec(
-			`INSERT INTO message_recipients (message_id, participant_id, recipient_type) VALUES (?, ?, 'bcc')`,
-			id, bccID,
+			`INSERT INTO message_recipients (message_id, participant_id, recipient_type) VALUES `+strings.Join(values, ", "),
+			args...,
 		)
 		if err != nil {
-			tdb.T.Fatalf("AddMessage bcc recipient: %v", err)
+			tdb.T.Fatalf("AddMessage recipients: %v", err)
 		}
 	}
 
@@ -11,6 +11,14 @@ import (
 // The database is automatically cleaned up when the test completes.
 func NewTestStore(t *testing.T) *store.Store {
 	t.Helper()
+	st, _ := NewTestStoreWithPath(t)
+	return st
+}
+
+// NewTestStoreWithPath is like NewTestStore but also returns the database
+// file path, for tests that open a second connection or inspect the file.
+func NewTestStoreWithPath(t *testing.T) (*store.Store, string) {
+	t.Helper()
 
 	dbPath := filepath.Join(t.TempDir(), "test.db")
 	st, err := store.Open(dbPath)
@@ -28,5 +36,41 @@ func NewTestStore(t *testing.T) *store.Store {
 		t.Fatalf("init schema: %v", err)
 	}
 
-	return st
+	return st, dbPath
+}
+
+// BlockWALCheckpoint pins a read transaction on a second connection to
+// dbPath and then commits a write through st, leaving the reader on a stale
+// snapshot so st.CheckpointWAL cannot complete. It lowers st's busy timeout
+// so the blocked checkpoint fails fast. The reader is released when the test
+// completes.
+func BlockWALCheckpoint(t *testing.T, st *store.Store, dbPath string) {
+	t.Helper()
+
+	reader, err := store.Open(dbPath)
+	if err != nil {
+		t.Fatalf("open reader: %v", err)
+	}
+	tx, err := reader.DB().Begin()
+	if err != nil {
+		reader.Close()
+		t.Fatalf("begin reader tx: %v", err)
+	}
+	t.Cleanup(func() {
+		_ = tx.Rollback()
+		reader.Close()
+	})
+
+	// The first read fixes the transaction's snapshot.
+	var n int
+	if err := tx.QueryRow("SELECT COUNT(*) FROM sources").Scan(&n); err != nil {
+		t.Fatalf("reader snapshot: %v", err)
+	}
+
+	if _, err := st.DB().Exec("PRAGMA busy_timeout = 50"); err != nil {
+		t.Fatalf("lower busy timeout: %v", err)
+	}
+	if _, err := st.GetOrCreateSource("gmail", "checkpoint-blocker@example.com"); err != nil {
+		t.Fatalf("write after snapshot: %v", err)
+	}
 }
@@ -412,9 +412,12 @@ func (m Model) aggregateTableView() string {
 	if len(m.rows) == 0 && !m.loading {
 		dataRows = 1 // the "No results found" row
 	}
-	for i := dataRows; i < m.pageSize-1; i++ {
-		sb.WriteString(normalRowStyle.Render(strings.Repeat(" ", m.width)))
-		sb.WriteString("\n")
+	if dataRows < m.pageSize-1 {
+		blankRow := normalRowStyle.Render(strings.Repeat(" ", m.width))
+		for i := dataRows; i < m.pageSize-1; i++ {
+			sb.WriteString(blankRow)
+			sb.WriteString("\n")
+		}
 	}
 
 	// Info line - show inline search bar when active, search filter when searching, otherwise blank
@@ -579,9 +582,12 @@ func (m Model) messageListView() string {
 	if len(m.messages) == 0 && !m.loading {
 		dataRows = 1 // the "No results found" row
 	}
-	for i := dataRows; i < m.pageSize-1; i++ {
-		sb.WriteString(normalRowStyle.Render(strings.Repeat(" ", m.width)))
-		sb.WriteString("\n")
+	if dataRows < m.pageSize-1 {
+		blankRow := normalRowStyle.Render(strings.Repeat(" ", m.width))
+		for i := dataRows; i < m.pageSize-1; i++ {
+			sb.WriteString(blankRow)
+			sb.WriteString("\n")
+		}
 	}
 
 	// Info line - show inline search bar when active, search info when searching, otherwise blank
@@ -705,12 +711,13 @@ func (m Model) fillScreenWithPageSize(content string, usedLines, pageSize int) s
 	sb.WriteString(content)
 	sb.WriteString("\n")
 	// Fill remaining space (minus 1 for notification line)
+	blankRow := normalRowStyle.Render(strings.Repeat(" ", m.width))
 	for i := usedLines; i < pageSize-1; i++ {
-		sb.WriteString(normalRowStyle.Render(strings.Repeat(" ", m.width)))
+		sb.WriteString(blankRow)
 		sb.WriteString("\n")
 	}
 	// Notification line (blank for now)
-	sb.WriteString(normalRowStyle.Render(strings.Repeat(" ", m.width)))
+	sb.WriteString(blankRow)
 	return sb.String()
 }
 
@@ -781,9 +788,12 @@ func (m Model) messageDetailView() string {
 	}
 
 	// Fill remaining space (minus 1 for notification line)
-	for i := len(visibleLines); i < detailPageSize-1; i++ {
-		sb.WriteString(normalRowStyle.Render(strings.Repeat(" ", m.width)))
-		sb.WriteString("\n")
+	if len(visibleLines) < detailPageSize-1 {
+		blankRow := normalRowStyle.Render(strings.Repeat(" ", m.width))
+		for i := len(visibleLines); i < detailPageSize-1; i++ {
+			sb.WriteString(blankRow)
+			sb.WriteString("\n")
+		}
 	}
 
 	// Notification line - show detail search bar, flash, loading, or blank
@@ -568,9 +568,11 @@ func fetchChecksumFromFile(url, assetName string) (string, error) {
 	return extractChecksum(string(body), assetName), nil
 }
 
+// sha256HexPattern matches a hex-encoded SHA-256 digest.
+var sha256HexPattern = regexp.MustCompile(`(?i)[a-f0-9]{64}`)
+
 func extractChecksum(releaseBody, assetName string) string {
 	lines := strings.Split(releaseBody, "\n")
-	re := regexp.MustCompile(`(?i)[a-f0-9]{64}`)
 	for _, line := range lines {
 		line = strings.TrimSpace(line)
 		// Parse as "checksum  filename" or "checksum filename" and compare filename exactly
@@ -578,7 +580,7 @@ func extractChecksum(releaseBody, assetName string) string {
 		if len(fields) >= 2 {
 			fname := strings.TrimPrefix(fields[1], "*") // sha256sum -b uses *filename
 			if fname == assetName {
-				if match := re.FindString(fields[0]); match != "" {
+				if match := sha256HexPattern.FindString(fields[0]); match != "" {
 					return strings.ToLower(match)
 				}
 			}